@@ -5,6 +5,7 @@
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 
 from . import database
@@ -59,6 +60,8 @@ def _construct_app() -> FastAPI:
         # Other.
         root_path=settings.fastapi_root_path,
         root_path_in_servers=True,
+        # Fast C-level JSON encoding for all responses.
+        default_response_class=ORJSONResponse,
     )
 
     # Initializing database connection and all ORM stuff.
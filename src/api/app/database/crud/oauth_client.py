@@ -5,6 +5,7 @@
 
 import secrets
 from app.database.models.oauth_client import OAuthClient
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 
@@ -66,6 +67,20 @@ def get_inactive_count(db: Session) -> int:
     return db.query(OAuthClient).filter(OAuthClient.is_active == False).count()
 
 
+def get_counters(db: Session):
+    """Returns all admin counters for clients with single query (one table scan)."""
+    return db.query(
+        func.count(OAuthClient.id).label("all_count"),
+        func.count(OAuthClient.id)
+        .filter(OAuthClient.is_active == True)
+        .label("active_count"),
+        func.count(OAuthClient.id)
+        .filter(OAuthClient.is_active == False)
+        .label("inactive_count"),
+        func.max(OAuthClient.time_created).label("last_created"),
+    ).one()
+
+
 def get_last(db: Session) -> OAuthClient:
     """Returns last created OAuth client."""
     return (
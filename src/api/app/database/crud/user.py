@@ -8,6 +8,7 @@ from app.config import get_settings
 from app.database.models.user import User
 from app.services.passwords import get_hashed_password
 from pyotp import random_base32
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 
@@ -61,6 +62,22 @@ def username_is_taken(db: Session, username: str) -> bool:
     return db.query(User).filter(User.username == username).first() is not None
 
 
+def email_or_username_is_taken(
+    db: Session, email: str, username: str
+) -> tuple[bool, bool]:
+    """Returns is given email and username taken or not, with single query for both."""
+    taken = (
+        db.query(User.email, User.username)
+        .filter(or_(User.email == email, User.username == username))
+        .limit(2)
+        .all()
+    )
+    return (
+        any(row.email == email for row in taken),
+        any(row.username == username for row in taken),
+    )
+
+
 def create(db: Session, username: str, email: str, password: str) -> User:
     """Creates user with given credentials."""
 
@@ -108,3 +125,16 @@ def get_admin_count(db: Session) -> int:
 def get_verified_count(db: Session) -> int:
     """Returns total number of verified email users in database."""
     return db.query(User).filter(User.is_verified == True).count()
+
+
+def get_counters(db: Session):
+    """Returns all admin counters for users with single query (one table scan)."""
+    return db.query(
+        func.count(User.id).label("all_count"),
+        func.count(User.id).filter(User.is_active == True).label("active_count"),
+        func.count(User.id).filter(User.is_active == False).label("inactive_count"),
+        func.count(User.id).filter(User.is_vip == True).label("vip_count"),
+        func.count(User.id).filter(User.is_admin == True).label("admin_count"),
+        func.count(User.id).filter(User.is_verified == True).label("verified_count"),
+        func.max(User.time_created).label("last_created"),
+    ).one()
@@ -10,7 +10,8 @@ from app.database.crud.user_agent import (
 )
 from app.database.models.user_agent import UserAgent
 from app.database.models.user_session import UserSession
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
 
 
 def generate_secret() -> str:
@@ -23,6 +24,29 @@ def get_by_id(db: Session, session_id: int) -> UserSession | None:
     return db.query(UserSession).filter(UserSession.id == session_id).first()
 
 
+def get_by_id_for_auth(db: Session, session_id: int) -> UserSession | None:
+    """
+    Returns session by it`s ID, with only columns the authentication path touches
+    (the owner user is still loaded eagerly (joined) as whole row,
+    as handlers and serializers use almost all of it`s columns).
+    """
+    return (
+        db.query(UserSession)
+        .options(
+            load_only(
+                UserSession.id,
+                UserSession.owner_id,
+                UserSession.token_secret,
+                UserSession.is_active,
+                UserSession.ip_address,
+                UserSession.user_agent_id,
+            )
+        )
+        .filter(UserSession.id == session_id)
+        .first()
+    )
+
+
 def get_all_by_owner_id(db: Session, owner_id: int) -> list[UserSession]:
     """Returns list of sessions by owner user id."""
     return db.query(UserSession).filter(UserSession.owner_id == owner_id).all()
@@ -106,6 +130,26 @@ def get_last(db: Session) -> UserSession:
     )
 
 
+def get_counters(db: Session):
+    """Returns all admin counters for sessions with single query (one table scan)."""
+    return db.query(
+        func.count(UserSession.id).label("all_count"),
+        func.count(UserSession.id)
+        .filter(UserSession.is_active == True)
+        .label("active_count"),
+        func.count(UserSession.id)
+        .filter(UserSession.is_active == False)
+        .label("inactive_count"),
+        func.count(func.distinct(UserSession.owner_id))
+        .filter(UserSession.is_active == True)
+        .label("active_grouped_count"),
+        func.count(func.distinct(UserSession.owner_id))
+        .filter(UserSession.is_active == False)
+        .label("inactive_grouped_count"),
+        func.max(UserSession.time_created).label("last_created"),
+    ).one()
+
+
 def get_or_create_new(
     db: Session, owner_id: int, client_host: str, client_user_agent: str
 ) -> UserSession:
@@ -4,7 +4,7 @@
 
 # Core model base.
 from app.database.core import Base
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 
 # ORM.
 from sqlalchemy.sql import func
@@ -14,6 +14,10 @@ class OAuthClient(Base):
     """Auth service OAuth2 client model"""
 
     __tablename__ = "oauth_clients"
+    __table_args__ = (
+        # For the admin activity counters.
+        Index("ix_oauth_clients_is_active", "is_active"),
+    )
 
     # Access data.
     id = Column(Integer, primary_key=True, index=True, nullable=False)
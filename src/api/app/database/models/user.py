@@ -4,7 +4,7 @@
 
 # Core model base.
 from app.database.core import Base
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text
 
 # ORM.
 from sqlalchemy.sql import func
@@ -14,6 +14,16 @@ class User(Base):
     """Auth service user model"""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # For the admin state counters (active / vip / verified),
+        # avoids full table scan on every admin dashboard poll.
+        Index(
+            "ix_users_is_active_is_vip_is_verified",
+            "is_active",
+            "is_vip",
+            "is_verified",
+        ),
+    )
 
     # Database.
     id = Column(Integer, primary_key=True, index=True, nullable=False)
@@ -30,6 +40,7 @@ class User(Base):
     last_name = Column(String, nullable=True)
 
     # Other.
+    # False is female (serialized as 0), true is male (serialized as 1).
     sex = Column(Boolean, nullable=False, default=False)
 
     # Password.
@@ -66,10 +77,6 @@ class User(Base):
     time_updated = Column(DateTime(timezone=True), onupdate=func.now())
     time_verified = Column(DateTime(timezone=True), nullable=True)
 
-    def is_female(self) -> bool:
-        """Returns is current user female of not."""
-        return self.sex is False
-
     def get_mention(self) -> str:
         """Returns user mention for email."""
         if self.first_name:
@@ -4,9 +4,10 @@
 
 # Core model base.
 from app.database.core import Base
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 
 # ORM.
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 
@@ -14,10 +15,26 @@ class UserSession(Base):
     """Auth service user session model"""
 
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        # Covering index for the admin counters (count / group by owner / last created
+        # filtered by activity), allows index-only scan instead of full table scan.
+        Index(
+            "ix_user_sessions_is_active",
+            "is_active",
+            postgresql_include=["owner_id", "time_created"],
+        ),
+        # For queries filtering sessions of one owner by activity.
+        Index("ix_user_sessions_owner_id_is_active", "owner_id", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, nullable=False)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
+    # Session owner user.
+    # Eager (joined) as authentication always queries session with it`s owner,
+    # so both are fetched with single SELECT instead of two.
+    owner = relationship("User", lazy="joined", uselist=False)
+
     token_secret = Column(String, nullable=False)
 
     ip_address = Column(String(12), nullable=False)
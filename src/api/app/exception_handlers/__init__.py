@@ -4,12 +4,6 @@
 """
 
 from app.services.api.errors import ApiErrorException
-from app.tokens.exceptions import (
-    TokenExpiredError,
-    TokenInvalidError,
-    TokenInvalidSignatureError,
-    TokenWrongTypeError,
-)
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 
@@ -26,16 +20,8 @@ def add_exception_handlers(app: FastAPI) -> None:
         RequestValidationError, _handlers.validation_exception_handler
     )
 
-    app.add_exception_handler(TokenExpiredError, _handlers.token_expired_error_handler)
-    app.add_exception_handler(
-        TokenWrongTypeError, _handlers.token_wrong_type_error_handler
-    )
-    app.add_exception_handler(TokenInvalidError, _handlers.token_invalid_error_handler)
-    app.add_exception_handler(
-        TokenInvalidSignatureError, _handlers.token_invalid_signature_error_handler
-    )
-
     app.add_exception_handler(429, _handlers.too_many_requests_handler)
 
-    app.add_exception_handler(404, _handlers.not_found_handler)
-    app.add_exception_handler(500, _handlers.internal_server_error_handler)
+    # All handlers that just respond with static API error.
+    for exception, handler in _handlers.STATIC_HANDLERS.items():
+        app.add_exception_handler(exception, handler)
@@ -5,6 +5,12 @@
 
 from app.services.api.errors import ApiErrorCode, ApiErrorException
 from app.services.api.response import api_error
+from app.tokens.exceptions import (
+    TokenExpiredError,
+    TokenInvalidError,
+    TokenInvalidSignatureError,
+    TokenWrongTypeError,
+)
 
 
 async def validation_exception_handler(_, exception):
@@ -29,48 +35,40 @@ async def api_error_exception_handler(_, e: ApiErrorException):
     return api_error(e.api_code, e.message, e.data)
 
 
-async def not_found_handler(_, __):
-    """Handler for FastAPI not found router error."""
-    return api_error(
-        ApiErrorCode.API_METHOD_NOT_FOUND,
-        "Method not found! Please read documentation.",
-    )
+def _make_handler(api_code: ApiErrorCode, message: str):
+    """Returns handler that always responds with given static API error."""
 
+    async def handler(_, __):
+        return api_error(api_code, message)
 
-async def internal_server_error_handler(_, __):
-    """Handler for FastAPI internal server error."""
-    return api_error(
-        ApiErrorCode.API_INTERNAL_SERVER_ERROR,
-        "Internal server error! Server is unavailable at this time. Please try again later.",
-    )
+    return handler
 
 
-async def token_wrong_type_error_handler(_, __):
-    """Handler for token module token wrong type error."""
-    return api_error(
+# Handlers that always respond with the same static API error,
+# built from single factory and registered by iterating this table
+# (exception type or status code, to the response it maps to).
+STATIC_HANDLERS = {
+    404: _make_handler(
+        ApiErrorCode.API_METHOD_NOT_FOUND,
+        "Method not found! Please read documentation.",
+    ),
+    500: _make_handler(
+        ApiErrorCode.API_INTERNAL_SERVER_ERROR,
+        "Internal server error! Server is unavailable at this time. Please try again later.",
+    ),
+    TokenWrongTypeError: _make_handler(
         ApiErrorCode.AUTH_INVALID_TOKEN,
         "Token has wrong type! Please read documentation for the required method.",
-    )
-
-
-async def token_expired_error_handler(_, __):
-    """Handler for token module token expired error."""
-    return api_error(
+    ),
+    TokenExpiredError: _make_handler(
         ApiErrorCode.AUTH_EXPIRED_TOKEN,
         "Token has been expired! Please get new fresh token.",
-    )
-
-
-async def token_invalid_signature_error_handler(_, __):
-    """Handler for token module token invalid signature error."""
-    return api_error(
+    ),
+    TokenInvalidSignatureError: _make_handler(
         ApiErrorCode.AUTH_INVALID_TOKEN,
         "Token has invalid signature! Means that server unable to verify that token signed by itself.",
-    )
-
-
-async def token_invalid_error_handler(_, __):
-    """Handler for token module token invalid error."""
-    return api_error(
+    ),
+    TokenInvalidError: _make_handler(
         ApiErrorCode.AUTH_INVALID_TOKEN, "Token invalid! No additonal information. "
-    )
+    ),
+}
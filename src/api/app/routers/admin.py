@@ -3,7 +3,7 @@
     Provides API methods (routes) for working with admin stuff.
 """
 
-import time
+import hashlib
 
 from app.config import Settings, get_settings
 from app.database import crud
@@ -14,11 +14,22 @@ from app.services.limiter.depends import RateLimiter
 from app.services.permissions import Permission
 from app.services.request import query_auth_data_from_request
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
 
 router = APIRouter()
 
 
+def _counters_etag(counters) -> str:
+    """
+    Returns ETag for counters row.
+    Counters change slowly relative to dashboard poll frequency,
+    so clients that poll with `If-None-Match` get 304 without response build.
+    """
+    digest = hashlib.blake2b(repr(tuple(counters)).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
 async def validate_admin_method_allowed(req: Request, db: Session, settings: Settings):
     """
     Validates that the method is allowed to be called.
@@ -28,8 +39,13 @@ async def validate_admin_method_allowed(req: Request, db: Session, settings: Set
             ApiErrorCode.API_FORBIDDEN, "Admin methods are disabled by administrator!"
         )
 
-    auth_data = query_auth_data_from_request(
-        req, db, required_permissions=[Permission.admin]
+    # Authentication does blocking database I/O,
+    # send it to the threadpool to not block the event loop with other requests.
+    auth_data = await run_in_threadpool(
+        query_auth_data_from_request,
+        req,
+        db,
+        required_permissions=[Permission.admin],
     )
     if not auth_data.user.is_admin:
         raise ApiErrorException(
@@ -45,25 +61,31 @@ async def method_admin_get_sessions_counters(
     settings: Settings = Depends(get_settings),
 ) -> JSONResponse:
     """Returns sessions counters."""
-    validate_admin_method_allowed(req, db, settings)
-    return api_success(
+    await validate_admin_method_allowed(req, db, settings)
+    counters = await run_in_threadpool(crud.user_session.get_counters, db)
+    etag = _counters_etag(counters)
+    if req.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response = api_success(
         {
             "sessions": {
-                "time_last_created": time.mktime(
-                    crud.user_session.get_last(db).time_created.timetuple()
-                ),
-                "all": crud.user_session.get_count(db),
+                "time_last_created": counters.last_created.timestamp()
+                if counters.last_created
+                else None,
+                "all": counters.all_count,
                 "inactive": {
-                    "count": crud.user_session.get_inactive_count(db),
-                    "grouped": crud.user_session.get_inactive_count_grouped(db),
+                    "count": counters.inactive_count,
+                    "grouped": counters.inactive_grouped_count,
                 },
                 "active": {
-                    "count": crud.user_session.get_active_count(db),
-                    "grouped": crud.user_session.get_active_count_grouped(db),
+                    "count": counters.active_count,
+                    "grouped": counters.active_grouped_count,
                 },
             }
         }
     )
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.get("/_admin.getOauthClientsCounters")
@@ -73,19 +95,25 @@ async def method_admin_get_oauth_clients_counters(
     settings: Settings = Depends(get_settings),
 ) -> JSONResponse:
     """Returns OAuth clients counters."""
-    validate_admin_method_allowed(req, db, settings)
-    return api_success(
+    await validate_admin_method_allowed(req, db, settings)
+    counters = await run_in_threadpool(crud.oauth_client.get_counters, db)
+    etag = _counters_etag(counters)
+    if req.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response = api_success(
         {
             "oauth_clients": {
-                "time_last_created": time.mktime(
-                    crud.oauth_client.get_last(db).time_created.timetuple()
-                ),
-                "all": crud.oauth_client.get_count(db),
-                "inactive": crud.oauth_client.get_inactive_count(db),
-                "active": crud.oauth_client.get_active_count(db),
+                "time_last_created": counters.last_created.timestamp()
+                if counters.last_created
+                else None,
+                "all": counters.all_count,
+                "inactive": counters.inactive_count,
+                "active": counters.active_count,
             }
         }
     )
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.get("/_admin.getUsersCounters")
@@ -95,19 +123,25 @@ async def method_admin_get_users_counters(
     settings: Settings = Depends(get_settings),
 ) -> JSONResponse:
     """Returns users counters."""
-    validate_admin_method_allowed(req, db, settings)
-    return api_success(
+    await validate_admin_method_allowed(req, db, settings)
+    counters = await run_in_threadpool(crud.user.get_counters, db)
+    etag = _counters_etag(counters)
+    if req.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response = api_success(
         {
             "users": {
-                "time_last_created": time.mktime(
-                    crud.user.get_last(db).time_created.timetuple()
-                ),
-                "all": crud.user.get_count(db),
-                "inactive": crud.user.get_inactive_count(db),
-                "active": crud.user.get_active_count(db),
-                "vip": crud.user.get_vip_count(db),
-                "admin": crud.user.get_admin_count(db),
-                "verified": crud.user.get_verified_count(db),
+                "time_last_created": counters.last_created.timestamp()
+                if counters.last_created
+                else None,
+                "all": counters.all_count,
+                "inactive": counters.inactive_count,
+                "active": counters.active_count,
+                "vip": counters.vip_count,
+                "admin": counters.admin_count,
+                "verified": counters.verified_count,
             }
         }
     )
+    response.headers["ETag"] = etag
+    return response
@@ -3,7 +3,7 @@
 """
 
 
-import time
+from functools import lru_cache
 
 from app.database.models.user import User
 
@@ -17,17 +17,67 @@ def serialize(
     include_profile_fields: bool = False
 ):
     """Returns dict object for API response with serialized user data."""
-    serialized_user = {
+    serializer = _build_serializer(
+        include_email,
+        include_optional_fields,
+        include_private_fields,
+        include_profile_fields,
+    )
+    return {"user": serializer(user)}
+
+
+@lru_cache(maxsize=None)
+def _build_serializer(
+    include_email: bool,
+    include_optional_fields: bool,
+    include_private_fields: bool,
+    include_profile_fields: bool,
+):
+    """
+    Returns serializer function specialized for given flags combination.
+    Flags are resolved once here (when the combination is first used),
+    instead of being re-branched for every serialized user,
+    which matters for list responses serializing N users.
+    """
+    sections = []
+    if include_profile_fields:
+        sections.append(_profile_fields)
+    if include_email and include_private_fields:
+        sections.append(_email_fields)
+    if include_optional_fields:
+        sections.append(
+            _optional_private_fields if include_private_fields else _optional_fields
+        )
+
+    if not sections:
+        # Most common (public) combination, plain base fields.
+        return _base_fields
+
+    def serializer(user: User) -> dict:
+        serialized_user = _base_fields(user)
+        for section in sections:
+            serialized_user.update(section(user))
+        return serialized_user
+
+    return serializer
+
+
+def _base_fields(user: User) -> dict:
+    """Returns always included user fields."""
+    return {
         "id": user.id,
         "username": user.username,
         "avatar": user.avatar,
         "first_name": user.first_name,
         "last_name": user.last_name,
-        "sex": 0 if user.is_female() else 1,
+        "sex": int(user.sex),
     }
 
-    if include_profile_fields:
-        serialized_user["profile"] = {
+
+def _profile_fields(user: User) -> dict:
+    """Returns public profile user fields."""
+    return {
+        "profile": {
             "bio": user.profile_bio,
             "website": user.profile_website,
             "socials": {
@@ -40,22 +90,32 @@ def serialize(
                 "auth_required": user.privacy_profile_require_auth,
             },
         }
+    }
 
-    if include_email and include_private_fields:
-        serialized_user["email"] = user.email
 
-    if include_optional_fields:
-        time_online = user.time_online
-        serialized_user["time_created"] = time.mktime(user.time_created.timetuple())
-        serialized_user["time_online"] = time.mktime(time_online.timetuple()) if time_online else None
-        serialized_user["states"] = {"is_active": user.is_active, "is_vip": user.is_vip}
+def _email_fields(user: User) -> dict:
+    """Returns private email user fields."""
+    return {"email": user.email}
+
+
+def _optional_fields(user: User) -> dict:
+    """Returns optional (times, states) user fields."""
+    time_online = user.time_online
+    return {
+        "time_created": user.time_created.timestamp(),
+        "time_online": time_online.timestamp() if time_online else None,
+        "states": {"is_active": user.is_active, "is_vip": user.is_vip},
+    }
 
-        if include_private_fields:
-            if user.is_admin:
-                serialized_user["states"]["is_admin"] = user.is_admin
-            serialized_user["states"]["is_confirmed"] = user.is_verified
 
-    return {"user": serialized_user}
+def _optional_private_fields(user: User) -> dict:
+    """Returns optional user fields with private states."""
+    serialized = _optional_fields(user)
+    states = serialized["states"]
+    if user.is_admin:
+        states["is_admin"] = user.is_admin
+    states["is_confirmed"] = user.is_verified
+    return serialized
 
 
 serialize_user = serialize
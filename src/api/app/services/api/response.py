@@ -2,7 +2,7 @@
     API response wrappers.
 """
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .errors import ApiErrorCode
 from .version import API_VERSION
@@ -13,7 +13,7 @@ def api_error(
     message: str = "",
     data: dict | None = None,
     headers: dict | None = None,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Returns API error response."""
 
     # Processing arguments.
@@ -23,7 +23,7 @@ def api_error(
         headers = {}
     code, status = api_code.value
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "v": API_VERSION,
             "error": {**{"message": message, "code": code, "status": status}, **data},
@@ -33,6 +33,6 @@ def api_error(
     )
 
 
-def api_success(data: dict) -> JSONResponse:
+def api_success(data: dict) -> ORJSONResponse:
     """Returns API success response."""
-    return JSONResponse({"v": API_VERSION, "success": {**data}}, status_code=200)
+    return ORJSONResponse({"v": API_VERSION, "success": {**data}}, status_code=200)
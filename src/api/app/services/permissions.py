@@ -72,24 +72,23 @@ def normalize_scope(scope: str) -> str:
     )
 
 
-def parse_permissions_from_scope(scope: str) -> list[Permission]:
+def parse_permissions_from_scope(scope: str) -> frozenset[Permission]:
     """
-    Returns list of permissions from scope, by parsing it.
+    Returns set of permissions from scope, by parsing it.
+    Frozenset, as consumers only do iteration and membership checks (O(1) hashed).
     """
     if not isinstance(scope, str):
         raise TypeError("Scope must be a string!")
     if SCOPE_PERMISSION_GRANT_ALL_TAG in scope:
         return SCOPE_ALL_PERMISSIONS
-    return list(
-        {
-            Permission(permission)
-            for permission in scope.split(SCOPE_PERMISSION_SEPARATOR)
-            if (permission and permission in SCOPE_ALLOWED_PERMISSIONS)
-        }
+    return frozenset(
+        Permission(permission)
+        for permission in scope.split(SCOPE_PERMISSION_SEPARATOR)
+        if (permission and permission in SCOPE_ALLOWED_PERMISSIONS)
     )
 
 
-def permissions_get_ttl(permissions: list[Permission], default_ttl: int) -> int:
+def permissions_get_ttl(permissions: frozenset[Permission], default_ttl: int) -> int:
     """
     Returns TTL for token, based on given permissions list.
     """
@@ -117,25 +116,24 @@ __CODE_PERMISSIONS_ORDER = [
 SCOPE_PERMISSION_GRANT_ALL_TAG = "*"
 SCOPE_PERMISSION_SEPARATOR = ","
 
-# List of all permissions.
-SCOPE_ALL_PERMISSIONS = [
-    Permission.oauth_clients,
-    Permission.email,
-    Permission.noexpire,
-    Permission.admin,
-    Permission.edit,
-    Permission.security,
-    Permission.sessions,
-    Permission.gatey,
-    Permission.ads,
-    Permission.messenger,
-    Permission.cc,
-]
-
-# Allowed permission, as string list.
-SCOPE_ALLOWED_PERMISSIONS = list(
-    map(
-        lambda p: p.value,
-        SCOPE_ALL_PERMISSIONS,
+# Set of all permissions.
+SCOPE_ALL_PERMISSIONS = frozenset(
+    (
+        Permission.oauth_clients,
+        Permission.email,
+        Permission.noexpire,
+        Permission.admin,
+        Permission.edit,
+        Permission.security,
+        Permission.sessions,
+        Permission.gatey,
+        Permission.ads,
+        Permission.messenger,
+        Permission.cc,
     )
 )
+
+# Allowed permission, as string set.
+SCOPE_ALLOWED_PERMISSIONS = frozenset(
+    permission.value for permission in SCOPE_ALL_PERMISSIONS
+)
@@ -4,7 +4,8 @@
     Root handler for authentication decode.
 """
 
-from typing import Type
+import hashlib
+import time
 from datetime import datetime
 
 from app.database import crud
@@ -17,6 +18,23 @@ from app.tokens import AccessToken, BaseToken, SessionToken
 from fastapi.requests import Request
 from sqlalchemy.orm import Session
 
+# In-process cache for already decoded (signature verified) tokens.
+# Maps SHA256 of the raw token string to the decoded token with it`s scope,
+# so repeated requests with the same token (SPA polling bursts) skip
+# JWT parsing and signature verification.
+# Session and user are still queried from the database on every request,
+# so logout / deactivation are applied immediately (no invalidation required).
+_TOKEN_CACHE: dict[str, tuple[float, BaseToken, str]] = {}
+_TOKEN_CACHE_TTL = 60
+_TOKEN_CACHE_MAX_SIZE = 4096
+
+# Debounce map for user online time updates (user id to last update time).
+# Without it, every authenticated request (even plain GET) becomes a write
+# transaction just to refresh `time_online`.
+_ONLINE_UPDATE_DEBOUNCE: dict[int, float] = {}
+_ONLINE_UPDATE_INTERVAL = 60
+_ONLINE_UPDATE_MAX_SIZE = 16384
+
 
 def query_auth_data_from_token(
     token: str,
@@ -40,10 +58,11 @@ def query_auth_data_from_token(
     """
 
     # Decode external token and query auth data from it.
-    token_type: Type[BaseToken] = SessionToken if only_session_token else AccessToken
-    auth_data = _decode_token(
+    # Decoder is specialized by token type, selected once here
+    # instead of re-checking the type on every decode step.
+    decode_token = _decode_session_token if only_session_token else _decode_access_token
+    auth_data = decode_token(
         token,
-        token_type,
         db,
         required_permissions=required_permissions,
         allow_external_clients=allow_external_clients,
@@ -142,40 +161,160 @@ def _get_token_from_request(req: Request, only_session_token: bool) -> str:
 
     # Simple access token located in header and params.
     # Notice that if user gives header and param, header should taken and param should skiped!
-    token_header = req.headers.get("Authorization", "")
-    token_param = req.query_params.get("access_token", "")
-    return token_header or token_param
+    # Header is the common path, return early so query params
+    # (which are parsed lazily) are not even touched.
+    token_header = req.headers.get("authorization")
+    if token_header:
+        return token_header
+    return req.query_params.get("access_token", "")
 
 
-def _decode_token(
+def _decode_access_token(
     token: str,
-    token_type: Type[BaseToken],
     db: Session,
     required_permissions: list[Permission] | None = None,
     request: Request | None = None,
     allow_external_clients: bool = False,
 ) -> AuthData:
     """
-    Decodes given token, to payload and session.
+    Decodes given access token, to payload and session.
+    Specialized for access tokens (scope is read from the token payload).
     :param token: Token to decode.
-    :param token_type: Token type to get.
     :param db: Database session.
     :param required_permissions: If passed, will require permission from token.
     """
 
-    if token_type is not AccessToken and token_type is not SessionToken:
-        raise ValueError(
-            "Unexpected type of the token type inside _decode_token! Should be access or session!"
-        )
+    if not token:
+        raise ApiErrorException(ApiErrorCode.AUTH_REQUIRED, "Authentication required!")
+
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached = _token_cache_get(cache_key)
+    if cached is not None:
+        signed_token, scope = cached
+        if isinstance(signed_token, AccessToken):
+            # Token was already decoded with verified signature recently,
+            # skip JWT parse / verify and only query session (with user) state.
+            return _query_cached_token_auth_data(
+                signed_token,
+                scope,
+                db,
+                required_permissions=required_permissions,
+                request=request,
+                allow_external_clients=allow_external_clients,
+            )
+
+    # Decode base token, scope (with permissions) is taken from the payload.
+    unsigned_token = AccessToken.decode_unsigned(token)
+    return _query_unsigned_token_auth_data(
+        token,
+        cache_key,
+        unsigned_token,
+        unsigned_token.get_scope(),  # pylint: disable=no-member
+        db,
+        required_permissions=required_permissions,
+        request=request,
+        allow_external_clients=allow_external_clients,
+    )
+
+
+def _decode_session_token(
+    token: str,
+    db: Session,
+    required_permissions: list[Permission] | None = None,
+    request: Request | None = None,
+    allow_external_clients: bool = False,
+) -> AuthData:
+    """
+    Decodes given session token, to payload and session.
+    Specialized for session tokens (which carry no scope at all).
+    :param token: Token to decode.
+    :param db: Database session.
+    :param required_permissions: If passed, will require permission from token.
+    """
 
     if not token:
         raise ApiErrorException(ApiErrorCode.AUTH_REQUIRED, "Authentication required!")
 
-    # Decode base token.
-    unsigned_token = token_type.decode_unsigned(token)
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached = _token_cache_get(cache_key)
+    if cached is not None:
+        signed_token, scope = cached
+        if isinstance(signed_token, SessionToken):
+            # Token was already decoded with verified signature recently,
+            # skip JWT parse / verify and only query session (with user) state.
+            return _query_cached_token_auth_data(
+                signed_token,
+                scope,
+                db,
+                required_permissions=required_permissions,
+                request=request,
+                allow_external_clients=allow_external_clients,
+            )
+
+    # Decode base token, session tokens have no scope (empty permissions).
+    unsigned_token = SessionToken.decode_unsigned(token)
+    return _query_unsigned_token_auth_data(
+        token,
+        cache_key,
+        unsigned_token,
+        "",
+        db,
+        required_permissions=required_permissions,
+        request=request,
+        allow_external_clients=allow_external_clients,
+    )
+
+
+def _query_cached_token_auth_data(
+    signed_token: BaseToken,
+    scope: str,
+    db: Session,
+    required_permissions: list[Permission] | None = None,
+    request: Request | None = None,
+    allow_external_clients: bool = False,
+) -> AuthData:
+    """
+    Queries auth data for token that was already decoded with verified signature.
+    :param signed_token: Decoded token with verified signature (from cache).
+    :param scope: Scope of the token.
+    :param db: Database session.
+    :param required_permissions: If passed, will require permission from token.
+    """
+    permissions = _query_scope_permissions(scope, required_permissions)
+    allow_external_clients = (
+        (Permission.noexpire in permissions) if not allow_external_clients else True
+    )
+    session = _query_session_from_sid(
+        signed_token.get_session_id(),
+        db,
+        request,
+        allow_external_clients=allow_external_clients,
+    )
+    return AuthData(token=signed_token, session=session, permissions=permissions)
+
+
+def _query_unsigned_token_auth_data(
+    token: str,
+    cache_key: str,
+    unsigned_token: BaseToken,
+    scope: str,
+    db: Session,
+    required_permissions: list[Permission] | None = None,
+    request: Request | None = None,
+    allow_external_clients: bool = False,
+) -> AuthData:
+    """
+    Queries auth data for freshly parsed (but not yet verified) token.
+    Checks permissions, queries session, verifies signature and caches the token.
+    :param token: Raw token string (for the signature verification).
+    :param cache_key: SHA256 hex digest of the raw token string.
+    :param unsigned_token: Parsed token with unverified signature.
+    :param scope: Scope of the token.
+    :param db: Database session.
+    :param required_permissions: If passed, will require permission from token.
+    """
 
     # Checks for token allowance.
-    scope = unsigned_token.get_scope() if token_type.get_type() == "access" else ""
     permissions = _query_scope_permissions(scope, required_permissions)
 
     # Query session, decode with valid signature.
@@ -188,7 +327,9 @@ def _decode_token(
         request,
         allow_external_clients=allow_external_clients,
     )
-    signed_token = token_type.decode(token, key=session.token_secret)
+    # Verify signature with single direct HMAC compare,
+    # payload was already parsed by the unsigned decode above.
+    signed_token = unsigned_token.verify(token, key=session.token_secret)
     if not signed_token.signature_is_valid():
         # If there is invalid signature on the token,
         # means token signed with another user, or old signature...
@@ -197,19 +338,64 @@ def _decode_token(
             "Unable to validate signature of the token!",
         )
 
+    # Cache decoded token for next requests with it.
+    _token_cache_put(cache_key, signed_token, scope)
+
     # Return DTO.
     return AuthData(token=signed_token, session=session, permissions=permissions)
 
 
+def _token_cache_get(cache_key: str) -> tuple[BaseToken, str] | None:
+    """
+    Returns cached decoded token with it`s scope, or None if not cached (or expired).
+    :param cache_key: SHA256 hex digest of the raw token string.
+    """
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached is None:
+        return None
+
+    cached_until, signed_token, scope = cached
+    if time.monotonic() >= cached_until:
+        # Cache entry expired, drop it.
+        _TOKEN_CACHE.pop(cache_key, None)
+        return None
+
+    return signed_token, scope
+
+
+def _token_cache_put(cache_key: str, signed_token: BaseToken, scope: str) -> None:
+    """
+    Caches decoded (signature verified) token with it`s scope for short period of time.
+    :param cache_key: SHA256 hex digest of the raw token string.
+    :param signed_token: Decoded token with verified signature.
+    :param scope: Scope of the token.
+    """
+
+    # Never cache longer than the token itself lives.
+    ttl = _TOKEN_CACHE_TTL
+    token_expires_at = signed_token.get_expires_at()
+    if token_expires_at:
+        ttl = min(ttl, token_expires_at - time.time())
+    if ttl <= 0:
+        return
+
+    if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+        # Cache overflow (a lot of unique tokens),
+        # dropping whole cache is cheaper than tracking LRU order on the hot path.
+        _TOKEN_CACHE.clear()
+
+    _TOKEN_CACHE[cache_key] = (time.monotonic() + ttl, signed_token, scope)
+
+
 def _query_scope_permissions(
     scope: str, required_permissions: list[Permission] | Permission | None = None
-) -> list[Permission]:
+) -> frozenset[Permission]:
     """
     Queries scope permissions with checking required permission (if passed).
     :param scope: Scope string (From request).
     :param required_permissions: Permissions to require, or just one permission, or no permissions.
     """
-    permissions: list[Permission] = parse_permissions_from_scope(scope)
+    permissions: frozenset[Permission] = parse_permissions_from_scope(scope)
 
     if not required_permissions:
         # If no permissions that should be required,
@@ -221,10 +407,13 @@ def _query_scope_permissions(
         # convert it to list as expected.
         required_permissions = [required_permissions]
 
-    # Filter scope permissions, and build list with only those permissions that not satisfied.
-    unsatisfied_permissions = list(
-        filter(lambda permission: permission not in permissions, required_permissions)
-    )
+    # Build list with only those required permissions that not satisfied.
+    # (parsed permissions are a hashed set, so each check is O(1))
+    unsatisfied_permissions = [
+        permission
+        for permission in required_permissions
+        if permission not in permissions
+    ]
 
     if unsatisfied_permissions:
         # If we have any permission that not satisfied.
@@ -261,7 +450,7 @@ def _query_session_from_sid(
         # Internal authentication system integrity check.
         _raise_integrity_check_error()
 
-    session = crud.user_session.get_by_id(db, session_id=session_id)
+    session = crud.user_session.get_by_id_for_auth(db, session_id=session_id)
     if not session:
         # Internal authentication system integrity check.
         # users should never be deleted and this should never happen.
@@ -298,11 +487,12 @@ def _query_auth_data(
     :param trigger_online_update: If true, will trigger online update for user.
     """
 
-    # Query database for our user to feed into auth data DTO.
+    # Session owner is loaded (joined) within the session query,
+    # so there is no additional query for the user here.
     user_id = auth_data.token.get_subject()
-    user = crud.user.get_by_id(db=db, user_id=user_id)
+    user = auth_data.session.owner
 
-    if not user or auth_data.session.owner_id != user.id:
+    if not user or user.id != user_id:
         # Internal authentication system integrity check.
         # users should never be deleted and this should never happen.
         _raise_integrity_check_error()
@@ -315,12 +505,14 @@ def _query_auth_data(
             "User account currently deactivated and this method does not allow deactivated users!",
         )
 
-    if trigger_online_update:
+    if trigger_online_update and _online_update_is_due(user.id):
         # If this flag is true, means that we should do update of the online time for user.
         # By default, this flag is enabled, means if you want to externally disable this trigger,
         # you should know that this is external trigger.
 
         # Do update of the online time for user.
+        # Debounced to at most once per interval per user,
+        # so not every authenticated request pays for a write transaction.
         user.time_online = datetime.now()
         db.commit()
 
@@ -329,6 +521,27 @@ def _query_auth_data(
     return auth_data
 
 
+def _online_update_is_due(user_id: int) -> bool:
+    """
+    Returns true at most once per debounce interval for given user,
+    marking the online time update as performed.
+    :param user_id: ID of the user that is updated.
+    """
+    now = time.monotonic()
+
+    last_updated_at = _ONLINE_UPDATE_DEBOUNCE.get(user_id)
+    if last_updated_at is not None and now - last_updated_at < _ONLINE_UPDATE_INTERVAL:
+        # Online time was updated recently, skip the write.
+        return False
+
+    if len(_ONLINE_UPDATE_DEBOUNCE) >= _ONLINE_UPDATE_MAX_SIZE:
+        # Keep the debounce map bounded (worst case is one extra write per user).
+        _ONLINE_UPDATE_DEBOUNCE.clear()
+
+    _ONLINE_UPDATE_DEBOUNCE[user_id] = now
+    return True
+
+
 def _raise_integrity_check_error():
     """
     Raises authentication system integrity check error.
@@ -14,14 +14,14 @@ class AuthData:
     user: User
     token: BaseToken
     session: UserSession
-    permissions: list[Permission] | None
+    permissions: frozenset[Permission] | None
 
     def __init__(
         self,
         token: BaseToken,
         session: UserSession,
         user: User | None = None,
-        permissions: list[Permission] | None = None,
+        permissions: frozenset[Permission] | None = None,
     ) -> None:
         """
         :param user: User database model object.
@@ -3,6 +3,8 @@
     (Session opened from another client).
 """
 
+import hashlib
+
 from app.config import get_settings
 from app.database import crud
 from app.database.models.user_session import UserSession
@@ -11,6 +13,13 @@ from app.services.request.get_client_host import get_client_host_from_request
 from fastapi import Request
 from sqlalchemy.orm import Session
 
+# Known-good client fingerprints (session id, ip, user agent triples)
+# that already passed the suspicious check.
+# Most requests come from the same device that opened the session,
+# so a hashed membership pre-check skips the user agent database query.
+_KNOWN_FINGERPRINTS: set[str] = set()
+_KNOWN_FINGERPRINTS_MAX_SIZE = 16384
+
 
 def session_check_client_by_request(
     db: Session, session: UserSession, request: Request
@@ -19,6 +28,11 @@ def session_check_client_by_request(
     Raises API exception if session does not pass internal auth system checks.
     """
 
+    fingerprint = _client_fingerprint(session, request)
+    if fingerprint in _KNOWN_FINGERPRINTS:
+        # Exactly this client already passed the check for this session.
+        return
+
     # If true, means that session detected as suspicious.
     is_suspicious = _check_session_is_suspicious(db, session, request)
 
@@ -27,6 +41,23 @@ def session_check_client_by_request(
             ApiErrorCode.AUTH_INVALID_TOKEN, "Session opened from another client!"
         )
 
+    if len(_KNOWN_FINGERPRINTS) >= _KNOWN_FINGERPRINTS_MAX_SIZE:
+        # Keep the fingerprint set bounded,
+        # worst case is one full check per client again.
+        _KNOWN_FINGERPRINTS.clear()
+    _KNOWN_FINGERPRINTS.add(fingerprint)
+
+
+def _client_fingerprint(session: UserSession, request: Request) -> str:
+    """
+    Returns hashed fingerprint of the client (for given session) from request.
+    """
+    client_host = get_client_host_from_request(request)
+    user_agent = request.headers.get("User-Agent")
+    return hashlib.blake2b(
+        f"{session.id}:{client_host}:{user_agent}".encode(), digest_size=16
+    ).hexdigest()
+
 
 def _check_session_is_suspicious(
     db: Session, session: UserSession, request: Request
@@ -2,6 +2,8 @@
     User validators.
 """
 
+import re
+
 from validate_email import validate_email
 
 
@@ -12,21 +14,58 @@ from app.database.models.user import User
 from app.services.passwords import check_password
 
 
+def _compile_username_regex() -> tuple[re.Pattern, str]:
+    """
+    Composes single pre-compiled username regex (with it`s error message),
+    based on the signup settings flags.
+    Single regex pass replaces separate length / isalpha / islower string scans.
+    """
+    settings = get_settings()
+
+    if settings.signup_username_reject_nonalpha:
+        if settings.signup_username_reject_uppercase:
+            charset, requirements = "[a-z]", "only lowercase latin (a-z) characters"
+        else:
+            charset, requirements = "[a-zA-Z]", "only latin (a-z, A-Z) characters"
+    elif settings.signup_username_reject_uppercase:
+        # Lookahead keeps `str.islower()` semantics:
+        # at least one lowercase character is required (not only digits / symbols).
+        charset, requirements = "(?=.*[a-z])[^A-Z]", "no uppercase characters"
+    else:
+        charset, requirements = ".", ""
+
+    message = "Username should be 5-16 characters long" + (
+        f" and contain {requirements}!" if requirements else "!"
+    )
+    return re.compile(f"{charset}{{5,16}}"), message
+
+
+# Compiled once at import time, as settings are static for process lifetime.
+_USERNAME_REGEX, _USERNAME_INVALID_MESSAGE = _compile_username_regex()
+
+
 def validate_signup_fields(db, username: str, email: str, password: str) -> None:
     """Validates that all fields passes signup base validation, or raises API error if not."""
 
     settings = get_settings()
 
-    # Check email is not taken.
-    if crud.user.email_is_taken(db=db, email=email):
+    # Cheap in-memory checks first,
+    # so malformed fields never hit the database at all.
+
+    # Check username with single pre-compiled regex pass.
+    if not _USERNAME_REGEX.fullmatch(username):
         raise ApiErrorException(
-            ApiErrorCode.AUTH_EMAIL_TAKEN, "Given email is already taken!"
+            ApiErrorCode.AUTH_USERNAME_INVALID, _USERNAME_INVALID_MESSAGE
         )
 
-    # Check username is not taken.
-    if crud.user.username_is_taken(db=db, username=username):
+    # Check password.
+    if len(password) <= 5:
         raise ApiErrorException(
-            ApiErrorCode.AUTH_USERNAME_TAKEN, "Given username is already taken!"
+            ApiErrorCode.AUTH_PASSWORD_INVALID, "Password should be longer than 5!"
+        )
+    if len(password) > 64:
+        raise ApiErrorException(
+            ApiErrorCode.AUTH_PASSWORD_INVALID, "Password should be shorten than 64!"
         )
 
     # Validate email.
@@ -35,34 +74,17 @@ def validate_signup_fields(db, username: str, email: str, password: str) -> None
     ):  # TODO.
         raise ApiErrorException(ApiErrorCode.AUTH_EMAIL_INVALID, "Email invalid!")
 
-    # Check username.
-    if len(username) <= 4:
-        raise ApiErrorException(
-            ApiErrorCode.AUTH_USERNAME_INVALID, "Username should be longer than 4!"
-        )
-    if len(username) > 16:
-        raise ApiErrorException(
-            ApiErrorCode.AUTH_USERNAME_INVALID, "Username should be shorten than 16!"
-        )
-    if settings.signup_username_reject_nonalpha and not username.isalpha():
+    # Check email and username are not taken (single query for both).
+    email_is_taken, username_is_taken = crud.user.email_or_username_is_taken(
+        db=db, email=email, username=username
+    )
+    if email_is_taken:
         raise ApiErrorException(
-            ApiErrorCode.AUTH_USERNAME_INVALID,
-            "Username should only contain alphabet characters!",
-        )
-    if settings.signup_username_reject_uppercase and not username.islower():
-        raise ApiErrorException(
-            ApiErrorCode.AUTH_USERNAME_INVALID,
-            "Username should only contain lowercase characters!",
-        )
-
-    # Check password.
-    if len(password) <= 5:
-        raise ApiErrorException(
-            ApiErrorCode.AUTH_PASSWORD_INVALID, "Password should be longer than 5!"
+            ApiErrorCode.AUTH_EMAIL_TAKEN, "Given email is already taken!"
         )
-    if len(password) > 64:
+    if username_is_taken:
         raise ApiErrorException(
-            ApiErrorCode.AUTH_PASSWORD_INVALID, "Password should be shorten than 64!"
+            ApiErrorCode.AUTH_USERNAME_TAKEN, "Given username is already taken!"
         )
 
 
@@ -24,14 +24,17 @@ class TestPermissionsUnit(unittest.TestCase):
         self.assertEqual(normalize_scope("\nemail, \remail"), "")
 
     def test_parse(self):
-        """Checking main parsing feature (scope to permissions list)."""
+        """Checking main parsing feature (scope to permissions set)."""
         with self.assertRaises(TypeError):
             parse_permissions_from_scope([Permission.email])  # noqa
-        self.assertIsInstance(parse_permissions_from_scope(""), list)
-        self.assertEqual(parse_permissions_from_scope(""), [])
-        self.assertEqual(parse_permissions_from_scope("email"), [Permission.email])
+        self.assertIsInstance(parse_permissions_from_scope(""), frozenset)
+        self.assertEqual(parse_permissions_from_scope(""), frozenset())
         self.assertEqual(
-            parse_permissions_from_scope("email,  email"), [Permission.email]
+            parse_permissions_from_scope("email"), frozenset({Permission.email})
         )
-        self.assertEqual(parse_permissions_from_scope("\nemail, \remail"), [])
+        self.assertEqual(
+            parse_permissions_from_scope("email,  email"),
+            frozenset({Permission.email}),
+        )
+        self.assertEqual(parse_permissions_from_scope("\nemail, \remail"), frozenset())
         self.assertTrue(Permission.email in parse_permissions_from_scope("*"))
@@ -6,6 +6,7 @@
 import unittest
 
 from app.tokens import AccessToken
+from app.tokens.exceptions import TokenInvalidSignatureError
 
 
 class TestAccessTokenUnit(unittest.TestCase):
@@ -30,6 +31,22 @@ class TestAccessTokenUnit(unittest.TestCase):
             decoded_signed_token.get_session_id(),  # pylint: disable=no-member
         )
 
+    def test_access_token_verify(self):
+        """Test direct signature verification of unsigned decoded token."""
+        key = "my_secret_key"
+        encoded_token = AccessToken("me", 1, 2, 3, "", key=key).encode()
+
+        decoded_unsigned_token = AccessToken.decode_unsigned(encoded_token)
+        self.assertFalse(decoded_unsigned_token.signature_is_valid())
+
+        verified_token = decoded_unsigned_token.verify(encoded_token, key=key)
+        self.assertTrue(verified_token.signature_is_valid())
+
+        with self.assertRaises(TokenInvalidSignatureError):
+            AccessToken.decode_unsigned(encoded_token).verify(
+                encoded_token, key="wrong_key"
+            )
+
     def test_access_token(self):
         """Test base feature."""
         key = "my_secret_key"
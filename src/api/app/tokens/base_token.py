@@ -7,6 +7,9 @@
 """
 
 
+import base64  # Decoding JWT signature part.
+import hashlib  # Direct HMAC-SHA256 signature verification.
+import hmac  # Direct HMAC-SHA256 signature verification.
 import time  # Utils for expiration dates.
 
 import jwt  # Library with base JWT implementation.
@@ -237,6 +240,46 @@ class BaseToken:
 
         return instance
 
+    def verify(self, token: str, *, key: str):
+        """
+        Verifies signature (with expiration) of the raw token string
+        this instance was decoded (unsigned) from, and returns the instance
+        marked as signature valid.
+
+        Unlike `decode` with a key, this does not base64-decode and JSON-parse
+        the payload a second time: the signature is checked with one direct
+        HMAC compare over the already available signing input.
+
+        Raises same core exceptions as signed `decode` would
+        (invalid signature / expired / invalid token).
+        """
+
+        if self._signing_algorithm != "HS256":
+            # Direct compare is implemented for HMAC-SHA256 only,
+            # fall back to full library decode for other algorithms.
+            return self.decode(token, key=key)
+
+        signing_input, _, signature = token.rpartition(".")
+        try:
+            decoded_signature = base64.urlsafe_b64decode(
+                (signature + "=" * (-len(signature) % 4)).encode("ascii")
+            )
+        except (ValueError, UnicodeEncodeError) as signature_decode_error:
+            raise exceptions.TokenInvalidError from signature_decode_error
+
+        digest = hmac.new(
+            key.encode("utf-8"), signing_input.encode("ascii"), hashlib.sha256
+        ).digest()
+        if not hmac.compare_digest(decoded_signature, digest):
+            raise exceptions.TokenInvalidSignatureError
+
+        if self._expires_at and self._expires_at < time.time():
+            # Same check the library does for the `exp` claim on signed decode.
+            raise exceptions.TokenExpiredError
+
+        self._signature_is_valid = True
+        return self
+
     @classmethod
     def decode_unsigned(cls, token: str):
         """
@@ -57,7 +57,7 @@ backlog = 2048  # Default, maximal, relates to high-load. (Limit for pending cli
 # Worker.
 # https://docs.gunicorn.org/en/latest/settings.html#worker-processes
 workers = 2 * cpu_count() + 1  # (Default: 1). Generally in range (2-4 x ${NUM_CORES}).
-worker_class = "uvicorn.workers.UvicornWorker"  # Not default, Uvicorn worker as we are using Uvicorn.
+worker_class = "uvicorn.workers.UvicornWorker"  # Not default, Uvicorn worker as we are using Uvicorn. Worker auto-selects `uvloop` loop and `httptools` HTTP parsing as those are installed.
 worker_connections = 1000  # Not affects, due to worker type.
 threads = 1  # Not affects, as only works with `gthread` worker class.
 max_requests = 32_000  # (Default: 0, no restart) Number of requests, after which worker will restart.